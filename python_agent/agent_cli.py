@@ -2,9 +2,11 @@
 """
 Interactive CLI for the Bin Packing Agent System
 """
+import contextlib
+import io
 import os
 import sys
-from agent_system import BinPackingAgent
+from concurrent.futures import ProcessPoolExecutor
 
 
 def print_banner():
@@ -87,8 +89,9 @@ def run_custom_optimization(agent):
     print("  b. Custom item types")
     print("  c. Different bin sizes")
     print("  d. Custom request")
+    print("  e. Batch of item counts (runs in parallel)")
     
-    sub_choice = input("Choose option (a-d): ").strip().lower()
+    sub_choice = input("Choose option (a-e): ").strip().lower()
     
     if sub_choice == 'a':
         num_items = input("Enter number of items (default 230): ").strip()
@@ -108,6 +111,10 @@ def run_custom_optimization(agent):
     elif sub_choice == 'd':
         custom_request = input("Enter your custom request: ")
         request = f"Please {custom_request}"
+    elif sub_choice == 'e':
+        counts = input("Enter item counts separated by commas (e.g. 50,100,230): ").strip()
+        run_batch_optimization(counts)
+        return
     else:
         print("❌ Invalid choice. Using default optimization.")
         request = "Please optimize the bin packing problem with default settings."
@@ -116,6 +123,78 @@ def run_custom_optimization(agent):
     print(f"\n🤖 Agent Response:\n{result}")
 
 
+def _init_batch_worker(classpath):
+    """Give a batch worker the classpath the parent already resolved"""
+    from utils.java_runner import set_classpath
+    set_classpath(classpath)
+
+
+def _run_single_opt(num_items: int) -> dict:
+    """Run one optimization with the given number of items (batch worker)"""
+    from tools.optimization_tools import run_optimization
+    from results_storage import load_optimization_result
+    from utils.item_generator import generate_items, generate_standard_bins
+    
+    # Collect the worker's progress output so the parent can print it per
+    # run instead of interleaving it with the other workers
+    log = io.StringIO()
+    try:
+        with contextlib.redirect_stdout(log):
+            result_file = run_optimization({"items": generate_items(num_items), "bins": generate_standard_bins()})
+            result = load_optimization_result(result_file)
+    except Exception as e:
+        return {"num_items": num_items, "error": str(e), "log": log.getvalue()}
+    
+    return {
+        "num_items": num_items,
+        "result_file": result_file,
+        "fitness": result.get('fitness', 0.0),
+        "packed_value": result.get('packed_value', 0.0),
+        "items_placed": len(result.get('plan', [])),
+        "log": log.getvalue()
+    }
+
+
+def run_batch_optimization(counts_text: str):
+    """Run several optimizations in parallel, one JVM per item count"""
+    try:
+        counts = [int(count) for count in counts_text.split(',') if count.strip()]
+    except ValueError:
+        print("❌ Invalid item counts. Please enter numbers separated by commas.")
+        return
+    
+    counts = [count for count in counts if count > 0]
+    if not counts:
+        print("❌ No item counts given.")
+        return
+    
+    from utils.java_runner import resolve_classpath
+    
+    # Resolve the classpath once here; workers reuse it instead of each
+    # running Maven against the same target directory
+    classpath = resolve_classpath()
+    
+    workers = min(len(counts), os.cpu_count() or 1)
+    print(f"\n🚀 Running {len(counts)} optimizations on {workers} worker(s)...")
+    with ProcessPoolExecutor(max_workers=workers, initializer=_init_batch_worker,
+                             initargs=(classpath,)) as executor:
+        results = list(executor.map(_run_single_opt, counts))
+    
+    # Print each run's output as one labelled block
+    for result in results:
+        for line in result["log"].splitlines():
+            print(f"[{result['num_items']} items] {line}")
+    
+    print("\n📊 Batch Results:")
+    for result in results:
+        if "error" in result:
+            print(f"  {result['num_items']:>4} items: ❌ {result['error']}")
+        else:
+            print(f"  {result['num_items']:>4} items: fitness {result['fitness']:.2f}, "
+                  f"packed value ${result['packed_value']:,.2f}, "
+                  f"{result['items_placed']} placed -> {result['result_file']}")
+
+
 def show_help():
     """Show help information"""
     print("\n📖 HELP")
@@ -150,6 +229,7 @@ def main():
     # Create agent
     try:
         print("🤖 Initializing agent...")
+        from agent_system import BinPackingAgent
         agent = BinPackingAgent()
         print("✅ Agent ready!")
     except Exception as e:
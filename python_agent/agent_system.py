@@ -2,42 +2,60 @@
 """
 Agent-based bin packing optimization and simulation system
 """
-from agents import Agent, Runner
+from typing import Optional
+from agents import Agent, ModelSettings, Runner
 from tools.optimization_tools import optimize_bin_packing, simulate_bin_packing
+from utils.java_runner import check_java_tools, resolve_classpath
+
+
+_INSTRUCTIONS = """You are a specialized agent for 2D bin packing optimization and simulation. 
+You have two main capabilities:
+1. Run genetic algorithm optimization to find the best packing plan
+2. Execute and visualize the packing plan in a GUI simulation
+
+When given a bin packing problem, you should:
+1. First run the optimization to get the best packing plan (this saves results to a file)
+2. Then execute the simulation using the result file path from step 1
+
+IMPORTANT: The optimization tool saves results to a file and returns a file path. 
+You must pass this file path to the simulation tool, not the raw data.
+
+Always provide clear feedback about what you're doing and the results."""
+
+_TOOLS = [
+    optimize_bin_packing,
+    simulate_bin_packing
+]
 
 
 class BinPackingAgent:
     """Main agent for bin packing optimization and simulation"""
     
+    # Agent shared by every BinPackingAgent in the process, built on first use
+    _shared_agent: Optional[Agent] = None
+    
     def __init__(self):
-        self.agent = Agent(
-            name="BinPackingOptimizer",
-            instructions="""You are a specialized agent for 2D bin packing optimization and simulation. 
-            You have two main capabilities:
-            1. Run genetic algorithm optimization to find the best packing plan
-            2. Execute and visualize the packing plan in a GUI simulation
-            
-            When given a bin packing problem, you should:
-            1. First run the optimization to get the best packing plan (this saves results to a file)
-            2. Then execute the simulation using the result file path from step 1
-            
-            IMPORTANT: The optimization tool saves results to a file and returns a file path. 
-            You must pass this file path to the simulation tool, not the raw data.
-            
-            Always provide clear feedback about what you're doing and the results.""",
-            model="gpt-4o-mini"
-        )
+        check_java_tools()
         
-        # Add tools to the agent
-        self.agent.tools = [
-            optimize_bin_packing,
-            simulate_bin_packing
-        ]
-    
+        if BinPackingAgent._shared_agent is None:
+            BinPackingAgent._shared_agent = Agent(
+                name="BinPackingOptimizer",
+                instructions=_INSTRUCTIONS,
+                model="gpt-4o-mini",
+                model_settings=ModelSettings(parallel_tool_calls=True),
+                tools=_TOOLS
+            )
+        self.agent = BinPackingAgent._shared_agent
+        
+        # Resolve the Java classpath up front so each optimization
+        # launches the JVM directly instead of going through Maven
+        resolve_classpath()
     
     def run(self, user_input: str) -> str:
         """Run the agent with user input"""
         print(f"Running agent with input: {user_input}")
+        # run_sync reuses one event loop across calls, so the SDK's shared
+        # HTTP client is never left bound to a closed loop
         result = Runner.run_sync(self.agent, user_input)
         return result.final_output
 
@@ -4,9 +4,78 @@ Results storage system for optimization outputs
 """
 import json
 import os
+import re
 import tempfile
+import threading
+import time
+from collections import OrderedDict
 from datetime import datetime
-from typing import Dict, Any, Optional
+from typing import Dict, Any, Optional, Tuple
+
+import orjson
+
+
+# Matches the timestamped names generated by save_optimization_result
+_RESULT_RE = re.compile(r'^optimization_result_\d{8}_\d{6}(_\d{6})?\.json$')
+
+# Use temp directory for results, resolved once at import
+_RESULTS_DIR = os.path.join(tempfile.gettempdir(), "bin_packing_results")
+os.makedirs(_RESULTS_DIR, exist_ok=True)
+
+# Recent results kept in memory, keyed by file path, so loading a result
+# this process just saved skips the disk read. Entries hold the serialized
+# JSON bytes with the file's st_mtime_ns: a file rewritten since it was
+# cached is reloaded, and every hit decodes a fresh dict for the caller
+_CACHE_SIZE = 8
+_CACHE: "OrderedDict[str, Tuple[int, bytes]]" = OrderedDict()
+_CACHE_LOCK = threading.Lock()
+
+
+def put_result(file_path: str, data: bytes) -> None:
+    """
+    Cache the serialized JSON of an optimization result under its file path.
+    
+    Args:
+        file_path: Path the result was saved to
+        data: The JSON bytes written to or read from the file
+    """
+    key = os.path.abspath(file_path)
+    try:
+        mtime_ns = os.stat(key).st_mtime_ns
+    except OSError:
+        return
+    with _CACHE_LOCK:
+        _CACHE[key] = (mtime_ns, data)
+        _CACHE.move_to_end(key)
+        while len(_CACHE) > _CACHE_SIZE:
+            _CACHE.popitem(last=False)
+
+
+def get_result(file_path: str) -> Optional[Dict[str, Any]]:
+    """
+    Get a cached optimization result.
+    
+    Args:
+        file_path: Path the result was saved to
+        
+    Returns:
+        A freshly decoded result dictionary, or None on a cache miss
+        or when the file changed since it was cached
+    """
+    key = os.path.abspath(file_path)
+    try:
+        mtime_ns = os.stat(key).st_mtime_ns
+    except OSError:
+        mtime_ns = None
+    with _CACHE_LOCK:
+        entry = _CACHE.get(key)
+        if entry is None:
+            return None
+        if entry[0] != mtime_ns:
+            del _CACHE[key]
+            return None
+        _CACHE.move_to_end(key)
+    return orjson.loads(entry[1])
 
 
 def save_optimization_result(result: Dict[str, Any], filename: Optional[str] = None) -> str:
@@ -24,18 +93,17 @@ def save_optimization_result(result: Dict[str, Any], filename: Optional[str] = N
         IOError: If file cannot be written
     """
     if filename is None:
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        # Microseconds keep concurrent optimizations from sharing a file
+        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S_%f")
         filename = f"optimization_result_{timestamp}.json"
     
-    # Use temp directory for results
-    results_dir = os.path.join(tempfile.gettempdir(), "bin_packing_results")
-    os.makedirs(results_dir, exist_ok=True)
-    
-    file_path = os.path.join(results_dir, filename)
+    file_path = os.path.join(_RESULTS_DIR, filename)
     
     try:
-        with open(file_path, 'w') as f:
-            json.dump(result, f, indent=2)
+        data = orjson.dumps(result, option=orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY)
+        with open(file_path, 'wb') as f:
+            f.write(data)
+        put_result(file_path, data)
         return file_path
     except Exception as e:
         raise IOError(f"Failed to save optimization result to {file_path}: {e}")
@@ -55,15 +123,22 @@ def load_optimization_result(file_path: str) -> Dict[str, Any]:
         IOError: If file cannot be read
         json.JSONDecodeError: If file contains invalid JSON
     """
+    cached = get_result(file_path)
+    if cached is not None:
+        return cached
+    
     if not os.path.exists(file_path):
         raise IOError(f"Optimization result file not found: {file_path}")
     
     try:
-        with open(file_path, 'r') as f:
-            result = json.load(f)
+        with open(file_path, 'rb') as f:
+            data = f.read()
+        result = orjson.loads(data)
+        put_result(file_path, data)
         return result
     except json.JSONDecodeError as e:
-        raise json.JSONDecodeError(f"Invalid JSON in optimization result file {file_path}: {e}")
+        # orjson.JSONDecodeError is a subclass of json.JSONDecodeError
+        raise json.JSONDecodeError(f"Invalid JSON in optimization result file {file_path}: {e.msg}", e.doc, e.pos)
     except Exception as e:
         raise IOError(f"Failed to load optimization result from {file_path}: {e}")
 
@@ -78,23 +153,16 @@ def cleanup_old_results(max_age_hours: int = 24) -> int:
     Returns:
         Number of files cleaned up
     """
-    results_dir = os.path.join(tempfile.gettempdir(), "bin_packing_results")
-    
-    if not os.path.exists(results_dir):
-        return 0
-    
-    current_time = datetime.now().timestamp()
-    max_age_seconds = max_age_hours * 3600
+    mtime_floor = time.time() - max_age_hours * 3600
     cleaned_count = 0
     
     try:
-        for filename in os.listdir(results_dir):
-            if filename.startswith("optimization_result_") and filename.endswith(".json"):
-                file_path = os.path.join(results_dir, filename)
-                file_age = current_time - os.path.getmtime(file_path)
-                
-                if file_age > max_age_seconds:
-                    os.remove(file_path)
+        with os.scandir(_RESULTS_DIR) as entries:
+            for entry in entries:
+                if _RESULT_RE.match(entry.name) and entry.stat().st_mtime < mtime_floor:
+                    os.unlink(entry.path)
+                    with _CACHE_LOCK:
+                        _CACHE.pop(os.path.abspath(entry.path), None)
                     cleaned_count += 1
     except Exception:
         # Ignore cleanup errors
@@ -2,18 +2,46 @@
 """
 Simple simulation that runs optimization and shows GUI
 """
+import argparse
+import asyncio
 import json
-import subprocess
-import tempfile
 import os
-import threading
-import time
-from simulation.gui import BinPackingSimulation
-from utils.item_generator import generate_full_230_items, generate_standard_bins, print_item_distribution
 
+import orjson
 
-def run_optimization():
+from utils.java_runner import build_java_command, check_java_tools
+
+# Project root containing pom.xml, resolved once at import
+_PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+async def read_stream(stream) -> bytearray:
+    """Accumulate a subprocess stream into a single buffer"""
+    buf = bytearray()
+    while True:
+        chunk = await stream.read(65536)
+        if not chunk:
+            break
+        buf += chunk
+    return buf
+
+
+async def write_stream(stream, data: bytes):
+    """Write a payload to a subprocess stream and close it"""
+    try:
+        stream.write(data)
+        await stream.drain()
+    except (BrokenPipeError, ConnectionResetError):
+        # Process exited early; its return code reports the failure
+        pass
+    finally:
+        stream.close()
+
+
+async def run_optimization():
     """Run Java optimization and return results"""
+    from utils.item_generator import generate_full_230_items, generate_standard_bins, print_item_distribution
+    
     print("🔍 Running Java optimization...")
     
     # Generate the full item configuration (230 items total)
@@ -25,141 +53,164 @@ def run_optimization():
     input_data = {"items": items, "bins": bins}
     
     try:
-        # Write to temporary file
-        with tempfile.NamedTemporaryFile(mode='w', suffix='.json', delete=False) as temp_file:
-            json.dump(input_data, temp_file, indent=2)
-            temp_file_path = temp_file.name
+        # Run Java GA optimization, feeding the input JSON through stdin.
+        # The classpath is resolved once, off the event loop.
+        cmd = await asyncio.to_thread(build_java_command, ["--input", "-", "--headless"])
+        
+        print(f"📦 Optimizing {len(items)} items...")
+        proc = await asyncio.create_subprocess_exec(
+            *cmd,
+            cwd=_PROJECT_ROOT,
+            stdin=asyncio.subprocess.PIPE,
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.PIPE
+        )
         
         try:
-            # Get the project root directory
-            project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
-            
-            # Run Java GA optimization
-            cmd = [
-                "mvn", "exec:java", 
-                f"-Dexec.args=--input {temp_file_path} --headless"
-            ]
-            
-            print(f"📦 Optimizing {len(items)} items...")
-            result = subprocess.run(
-                cmd,
-                cwd=project_root,
-                capture_output=True,
-                text=True,
-                timeout=300
-            )
-            
-            if result.returncode != 0:
-                print(f"❌ Java optimization failed: {result.stderr}")
-                return None
-            
-            # Parse JSON output
-            output_lines = result.stdout.split('\n')
-            json_start = -1
-            json_end = -1
-            
-            # Find the first complete JSON object
-            for i, line in enumerate(output_lines):
-                if line.strip().startswith('{'):
-                    json_start = i
-                    break
-            
-            if json_start == -1:
-                print("❌ No JSON output found!")
-                return None
-            
-            # Find where the JSON ends
-            brace_count = 0
-            for i in range(json_start, len(output_lines)):
-                line = output_lines[i]
-                for char in line:
-                    if char == '{':
-                        brace_count += 1
-                    elif char == '}':
-                        brace_count -= 1
-                        if brace_count == 0:
-                            json_end = i + 1
-                            break
-                if json_end != -1:
-                    break
-            
-            if json_end == -1:
-                print("❌ Incomplete JSON output found!")
-                return None
-            
-            # Extract JSON part
-            json_output = '\n'.join(output_lines[json_start:json_end])
-            optimization_result = json.loads(json_output)
-            
-            print("✅ Optimization completed!")
-            print(f"   Fitness: {optimization_result.get('fitness', 'N/A'):.2f}")
-            print(f"   Packed Value: ${optimization_result.get('packed_value', 'N/A'):,.2f}")
-            print(f"   Items Placed: {len(optimization_result.get('plan', []))}")
-            
-            return optimization_result
-            
+            async with asyncio.timeout(300):
+                _, stdout, stderr, _ = await asyncio.gather(
+                    write_stream(proc.stdin, orjson.dumps(input_data, default=dict)),
+                    read_stream(proc.stdout),
+                    read_stream(proc.stderr),
+                    proc.wait()
+                )
+        except TimeoutError:
+            proc.kill()
+            await proc.wait()
+            print("❌ Java optimization timed out!")
+            return None
         finally:
-            os.unlink(temp_file_path)
-            
+            # Never leave the JVM running, including when this task is
+            # cancelled (window closed or Ctrl-C)
+            if proc.returncode is None:
+                try:
+                    proc.kill()
+                except ProcessLookupError:
+                    pass
+        
+        if proc.returncode != 0:
+            print(f"❌ Java optimization failed: {stderr.decode(errors='replace')}")
+            return None
+        
+        # Parse the first complete JSON object in the output
+        idx = stdout.find(b'{')
+        if idx == -1:
+            print("❌ No JSON output found!")
+            return None
+        
+        text = stdout[idx:].decode(errors='replace')
+        decoder = json.JSONDecoder()
+        optimization_result = None
+        idx = 0
+        while idx != -1:
+            try:
+                optimization_result, _ = decoder.raw_decode(text, idx)
+                break
+            except json.JSONDecodeError:
+                # Stray brace in the Maven log, try the next one
+                idx = text.find('{', idx + 1)
+        
+        if optimization_result is None:
+            print("❌ Incomplete JSON output found!")
+            return None
+        
+        print("✅ Optimization completed!")
+        print(f"   Fitness: {optimization_result.get('fitness', 'N/A'):.2f}")
+        print(f"   Packed Value: ${optimization_result.get('packed_value', 'N/A'):,.2f}")
+        print(f"   Items Placed: {len(optimization_result.get('plan', []))}")
+        
+        return optimization_result
+        
     except Exception as e:
         print(f"❌ Error: {e}")
         return None
 
 
-def simulate_placement(sim, plan):
-    """Simulate placing items in the GUI"""
-    print("🎯 Starting simulation...")
+async def warmup_gui(optimization):
+    """Build the simulation GUI and keep it responsive while optimization runs"""
+    import tkinter as tk
+    from simulation.gui import BinPackingSimulation
     
-    for i, step in enumerate(plan):
-        print(f"Placing item {i+1}/{len(plan)}: {step['item_type']} in Bin {step['bin_id']}")
-        
-        # Place the item
-        result = sim.place_item(
-            step['item_id'],
-            step['bin_id'],
-            step['x'],
-            step['y'],
-            step['width'],
-            step['height'],
-            step['shape'],
-            step['item_type']
-        )
-        
-        if "Error" in result:
-            print(f"   ❌ {result}")
-        else:
-            print(f"   ✅ {result}")
-        
-        # Small delay for visual effect
-        time.sleep(0.1)
+    print("📱 Opening simulation GUI...")
+    sim = BinPackingSimulation()
+    title = sim.root.title()
+    loop = asyncio.get_running_loop()
+    started = loop.time()
+    
+    try:
+        # Pump Tk events until the Java process finishes
+        while not optimization.done():
+            elapsed = loop.time() - started
+            sim.root.title(f"{title} - optimizing... {elapsed:.0f}s")
+            sim.root.update()
+            await asyncio.sleep(0.05)
+        sim.root.title(title)
+    except tk.TclError:
+        # Window was closed before optimization finished; stop the Java run
+        # instead of waiting for it
+        optimization.cancel()
+        return None
     
-    print("🎉 Simulation completed!")
+    return sim
+
+
+async def prepare_simulation():
+    """Run optimization and GUI setup concurrently"""
+    optimization = asyncio.ensure_future(run_optimization())
+    try:
+        sim = await warmup_gui(optimization)
+    except BaseException:
+        optimization.cancel()
+        raise
+    
+    # The GUI loop only ends once optimization is done or cancelled;
+    # wait() lets the cancelled run finish killing its process
+    await asyncio.wait([optimization])
+    if sim is None:
+        return None, None
+    return optimization.result(), sim
+
+
+def parse_args():
+    """Parse command line arguments"""
+    parser = argparse.ArgumentParser(description="Run Java GA optimization and simulate the plan")
+    parser.add_argument("--step-ms", type=int, default=16,
+                        help="delay between placement batches in milliseconds (default: 16)")
+    parser.add_argument("--fast", type=int, nargs="?", const=10, default=1, dest="batch_size",
+                        metavar="N", help="place N items per batch (default N: 10)")
+    return parser.parse_args()
 
 
 def main():
     """Main simulation function"""
+    args = parse_args()
+    
     print("🚀 Java GA + Python Simulation")
     print("=" * 50)
     
-    # Run optimization
-    result = run_optimization()
+    try:
+        check_java_tools()
+    except RuntimeError as e:
+        print(f"❌ {e}")
+        return
+    
+    # Run optimization while the GUI is being built
+    result, sim = asyncio.run(prepare_simulation())
+    if sim is None:
+        print("❌ Simulation window was closed!")
+        return
+    
     if not result:
         print("❌ Optimization failed!")
+        sim.root.destroy()
         return
     
-    # Create simulation GUI
-    print("📱 Opening simulation GUI...")
-    sim = BinPackingSimulation()
-    
-    # Start simulation in a separate thread
+    # Schedule the placement steps on the GUI event loop
     plan = result.get('plan', [])
     if plan:
         print(f"📋 Executing {len(plan)} placement steps...")
-        
-        # Start simulation thread
-        sim_thread = threading.Thread(target=lambda: simulate_placement(sim, plan))
-        sim_thread.daemon = True
-        sim_thread.start()
+        print("🎯 Starting simulation...")
+        sim.play_plan(plan, step_ms=max(args.step_ms, 1), batch_size=max(args.batch_size, 1))
     
     # Run GUI (this will block until window is closed)
     sim.run()
@@ -2,21 +2,38 @@ import tkinter as tk
 from tkinter import ttk, messagebox
 import threading
 import queue
+import json
+import sys
 import math
-from typing import Dict, List, Any, Optional
+from typing import Dict, List, Any, Optional, Tuple
 from dataclasses import dataclass
+from PIL import Image, ImageDraw, ImageFont, ImageTk
+from simulation.model import BinPackingModel, PlacedItem
 
+# Number of placement steps whose status lines are written together
+LOG_FLUSH_STEPS = 32
 
-@dataclass
-class PlacedItem:
+
+def flush_log(log: List[str]):
+    """Write buffered status lines to stdout in a single call"""
+    if log:
+        sys.stdout.write('\n'.join(log) + '\n')
+        sys.stdout.flush()
+        log.clear()
+
+
+@dataclass(slots=True)
+class CanvasItem:
+    """A placed item's canvas geometry and fill color, computed once when it is placed"""
     item_id: int
-    item_type: str
-    bin_id: int
-    x: float
-    y: float
-    width: float
-    height: float
     shape: str
+    sx1: float
+    sy1: float
+    sx2: float
+    sy2: float
+    cx: float
+    cy: float
+    color: str
 
 
 class BinPackingSimulation:
@@ -25,13 +42,26 @@ class BinPackingSimulation:
         self.root.title("2D Bin Packing Simulation")
         self.root.geometry("1200x800")
         
-        # Simulation state
-        self.bins = {
-            0: {"width": 220, "height": 220, "items": []},
-            1: {"width": 180, "height": 200, "items": []},
-            2: {"width": 200, "height": 180, "items": []},
-            3: {"width": 160, "height": 160, "items": []}
-        }
+        # Simulation state lives in a Tk-free model; this class only draws it
+        self.model = BinPackingModel()
+        self.bins = self.model.bins
+        
+        # Canvas layout, with each bin's x offset computed once
+        self.scale = 2
+        self.padding = 20
+        self.bin_spacing = 20
+        self.bin_x_offsets = []
+        x_offset = self.padding
+        for bin_data in self.bins:
+            self.bin_x_offsets.append(x_offset)
+            x_offset += bin_data["width"] * self.scale + self.bin_spacing
+        self.canvas_width = int(x_offset - self.bin_spacing + self.padding)
+        self.canvas_height = int(max(b["height"] for b in self.bins) * self.scale + 2 * self.padding)
+        
+        # Scene is rendered off-screen into an image and blitted to the
+        # canvas as a single image item
+        self.font = ImageFont.load_default()
+        self.draw_bin_frames()
         
         # Color mapping for item types
         self.colors = {
@@ -48,6 +78,18 @@ class BinPackingSimulation:
         # Command queue for thread-safe communication
         self.command_queue = queue.Queue()
         
+        # Pre-rendered item images, keyed by (shape, color, width, height)
+        self.tile_cache: Dict[Tuple[str, str, float, float], Image.Image] = {}
+        
+        # Drawn items per bin in placement order (matching the model's
+        # column indices), with canvas geometry computed once at placement
+        self.drawn_items: List[List[CanvasItem]] = [[] for _ in self.bins]
+        
+        # Items placed since the last repaint
+        self.pending_items: List[CanvasItem] = []
+        self.stats_dirty = False
+        self.stats_scheduled = False
+        
         self.setup_ui()
         self.setup_command_processor()
         
@@ -76,12 +118,26 @@ class BinPackingSimulation:
         v_scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
         self.canvas.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
         
+        # Single canvas item showing the off-screen buffer
+        self.photo = ImageTk.PhotoImage(self.buffer)
+        self.buffer_item = self.canvas.create_image(0, 0, anchor="nw", image=self.photo)
+        self.canvas.configure(scrollregion=(0, 0, self.canvas_width, self.canvas_height))
+        
+        # Item IDs are not drawn into the buffer; one text item shows the
+        # ID of the item under the pointer
+        self.hover_text = self.canvas.create_text(0, 0, text="", fill="white", state="hidden")
+        self.canvas.bind("<Motion>", self.on_hover)
+        
         # Statistics frame
         stats_frame = ttk.LabelFrame(main_frame, text="Statistics", padding=10)
         stats_frame.pack(fill=tk.X, pady=(10, 0))
         
-        self.stats_text = tk.Text(stats_frame, height=6, width=80, font=("Courier", 10))
-        self.stats_text.pack(fill=tk.X)
+        # One label per bin plus totals, updated in place through StringVars
+        self.stats_vars: Dict[Any, tk.StringVar] = {}
+        for key in [*range(len(self.bins)), "total"]:
+            self.stats_vars[key] = tk.StringVar(master=self.root)
+            ttk.Label(stats_frame, textvariable=self.stats_vars[key],
+                      font=("Courier", 10)).pack(anchor=tk.W)
         
         # Control buttons
         button_frame = ttk.Frame(main_frame)
@@ -92,26 +148,37 @@ class BinPackingSimulation:
         ttk.Button(button_frame, text="Get State", 
                   command=self.print_state).pack(side=tk.LEFT)
         
-        # Draw initial bins
-        self.draw_bins()
-        
     def setup_command_processor(self):
         """Set up command processing for thread-safe updates"""
-        def process_commands():
+        # Producers signal new commands with a virtual event instead of the
+        # queue being polled; the initial drain picks up anything queued
+        # before the main loop started
+        self.root.bind("<<CmdQueued>>", lambda event: self.drain_queue())
+        self.root.after_idle(self.drain_queue)
+    
+    def queue_command(self, command: Dict[str, Any]):
+        """Queue a command and wake the Tk main loop to run it"""
+        self.command_queue.put(command)
+        try:
+            self.root.event_generate("<<CmdQueued>>", when="tail")
+        except (tk.TclError, RuntimeError):
+            # Window closed, or main loop not running yet (the initial
+            # drain will pick the command up)
+            pass
+    
+    def drain_queue(self):
+        """Run every queued command, then repaint once"""
+        while True:
             try:
-                while True:
-                    command = self.command_queue.get(timeout=0.1)
-                    if command is None:
-                        break
-                    self.execute_command(command)
+                command = self.command_queue.get_nowait()
             except queue.Empty:
-                pass
-            # Schedule next check
-            self.root.after(100, process_commands)
-        
-        process_commands()
+                break
+            if command is None:
+                break
+            self.execute_command(command, refresh=False)
+        self.refresh()
     
-    def execute_command(self, command: Dict[str, Any]):
+    def execute_command(self, command: Dict[str, Any], refresh: bool = True):
         """Execute a command from the queue"""
         cmd_type = command.get("type")
         
@@ -124,74 +191,114 @@ class BinPackingSimulation:
                 command["width"],
                 command["height"],
                 command["shape"],
-                command["item_type"]
+                command["item_type"],
+                refresh=refresh
             )
         elif cmd_type == "reset":
-            self.reset_simulation_sync()
+            self.reset_simulation_sync(refresh=refresh)
         elif cmd_type == "update_stats":
-            self.update_stats_sync()
+            self.stats_dirty = True
+            if refresh:
+                self.refresh()
+    
+    def refresh(self):
+        """Draw items placed since the last refresh and update statistics"""
+        if self.pending_items:
+            for item in self.pending_items:
+                self.draw_item(item)
+            self.pending_items.clear()
+            self.present()
+        
+        # Label updates wait for idle time so a burst of placements is
+        # reported once
+        if self.stats_dirty and not self.stats_scheduled:
+            self.stats_scheduled = True
+            self.root.after_idle(self.update_stats_sync)
     
-    def draw_bins(self):
-        """Draw the bin boundaries"""
-        self.canvas.delete("all")
+    def draw_bin_frames(self):
+        """Render the bin boundaries and labels, and start a fresh off-screen buffer from them"""
+        scale = self.scale
+        padding = self.padding
         
-        scale = 2
-        padding = 20
-        bin_spacing = 20
+        self.frames = Image.new("RGB", (self.canvas_width, self.canvas_height), "white")
+        draw = ImageDraw.Draw(self.frames)
         
-        x_offset = padding
-        for bin_id, bin_data in self.bins.items():
-            x1 = x_offset
+        for bin_id, bin_data in enumerate(self.bins):
+            x1 = self.bin_x_offsets[bin_id]
             y1 = padding
             x2 = x1 + bin_data["width"] * scale
             y2 = y1 + bin_data["height"] * scale
             
             # Draw bin boundary
-            self.canvas.create_rectangle(x1, y1, x2, y2, outline="black", width=2, fill="lightgray")
+            draw.rectangle([x1, y1, x2, y2], outline="black", width=2, fill="lightgray")
             
             # Draw bin label
-            self.canvas.create_text(x1 + 5, y1 + 5, text=f"Bin {bin_id}", 
-                                  anchor="nw", font=("Arial", 10, "bold"))
-            
-            # Draw items in this bin
-            for item in bin_data["items"]:
-                self.draw_item(item, x_offset, padding, scale)
-            
-            x_offset += bin_data["width"] * scale + bin_spacing
+            draw.text((x1 + 5, y1 + 5), f"Bin {bin_id}", fill="black", font=self.font)
         
-        # Update scroll region
-        self.canvas.configure(scrollregion=self.canvas.bbox("all"))
+        self.buffer = self.frames.copy()
     
-    def draw_item(self, item: PlacedItem, bin_x_offset: float, bin_y_offset: float, scale: float):
-        """Draw an item in the canvas"""
-        x1 = bin_x_offset + item.x * scale
-        y1 = bin_y_offset + item.y * scale
-        x2 = x1 + item.width * scale
-        y2 = y1 + item.height * scale
-        
-        color = self.colors.get(item.item_type, "gray")
+    def clear_items(self):
+        """Restore the off-screen buffer to just the bin frames"""
+        self.buffer.paste(self.frames)
+    
+    def present(self):
+        """Copy the off-screen buffer to the canvas image"""
+        self.photo.paste(self.buffer)
+    
+    def draw_item(self, item: CanvasItem):
+        """Paste an item's pre-rendered tile into the off-screen buffer"""
+        tile = self.get_tile(item)
+        self.buffer.paste(tile, (round(item.sx1), round(item.sy1)), tile)
+    
+    def get_tile(self, item: CanvasItem) -> Image.Image:
+        """Get the cached image for an item's shape, color and size, rendering it on first use"""
+        width = item.sx2 - item.sx1
+        height = item.sy2 - item.sy1
+        key = (item.shape, item.color, width, height)
+        tile = self.tile_cache.get(key)
+        if tile is not None:
+            return tile
+        
+        tile = Image.new("RGBA", (int(width) + 1, int(height) + 1), (0, 0, 0, 0))
+        draw = ImageDraw.Draw(tile)
+        color = item.color
         
         if item.shape == "RECTANGLE":
-            self.canvas.create_rectangle(x1, y1, x2, y2, fill=color, outline="black", width=1)
+            draw.rectangle([0, 0, width, height], fill=color, outline="black", width=1)
         elif item.shape == "CIRCLE":
-            # Draw circle using oval
-            diameter = min(item.width, item.height) * scale
-            self.canvas.create_oval(x1, y1, x1 + diameter, y1 + diameter, 
-                                  fill=color, outline="black", width=1)
+            # Draw circle using ellipse
+            diameter = min(width, height)
+            draw.ellipse([0, 0, diameter, diameter], fill=color, outline="black", width=1)
         elif item.shape == "TRIANGLE":
             # Draw triangle
             points = [
-                x1, y2,  # bottom left
-                x2, y2,  # bottom right
-                x1 + (x2 - x1) // 2, y1  # top center
+                (0, height),  # bottom left
+                (width, height),  # bottom right
+                (width // 2, 0)  # top center
             ]
-            self.canvas.create_polygon(points, fill=color, outline="black", width=1)
+            draw.polygon(points, fill=color, outline="black")
         
-        # Draw item ID
-        center_x = (x1 + x2) // 2
-        center_y = (y1 + y2) // 2
-        self.canvas.create_text(center_x, center_y, text=str(item.item_id), 
-                              font=("Arial", 8, "bold"), fill="white")
+        self.tile_cache[key] = tile
+        return tile
+    
+    def on_hover(self, event):
+        """Show the ID of the item under the pointer"""
+        x = self.canvas.canvasx(event.x)
+        y = self.canvas.canvasy(event.y)
+        
+        for bin_id, bin_data in enumerate(self.bins):
+            bin_x = (x - self.bin_x_offsets[bin_id]) / self.scale
+            bin_y = (y - self.padding) / self.scale
+            if 0 <= bin_x <= bin_data["width"] and 0 <= bin_y <= bin_data["height"]:
+                i = self.model.find_item_at(bin_id, bin_x, bin_y)
+                if i is not None:
+                    item = self.drawn_items[bin_id][i]
+                    self.canvas.coords(self.hover_text, item.cx, item.cy)
+                    self.canvas.itemconfigure(self.hover_text, text=str(item.item_id), state="normal")
+                    return
+                break
+        
+        self.canvas.itemconfigure(self.hover_text, state="hidden")
     
     def place_item(self, item_id: int, bin_id: int, x: float, y: float, 
                    width: float, height: float, shape: str, item_type: str = "Unknown") -> str:
@@ -207,116 +314,131 @@ class BinPackingSimulation:
             "shape": shape,
             "item_type": item_type
         }
-        self.command_queue.put(command)
+        self.queue_command(command)
         return f"Placed item {item_id} in bin {bin_id} at ({x}, {y})"
     
     def place_item_sync(self, item_id: int, bin_id: int, x: float, y: float, 
-                       width: float, height: float, shape: str, item_type: str):
-        """Place an item synchronously (called from main thread)"""
-        if bin_id not in self.bins:
-            return f"Error: Bin {bin_id} does not exist"
-        
-        # Check if item fits in bin
-        bin_data = self.bins[bin_id]
-        if x + width > bin_data["width"] or y + height > bin_data["height"]:
-            return f"Error: Item {item_id} does not fit in bin {bin_id}"
-        
-        # Check for overlaps
-        new_item = PlacedItem(item_id, item_type, bin_id, x, y, width, height, shape)
-        for existing_item in bin_data["items"]:
-            if self.items_overlap(new_item, existing_item):
-                return f"Error: Item {item_id} overlaps with existing item {existing_item.item_id}"
-        
-        # Add item to bin
-        bin_data["items"].append(new_item)
-        
-        # Redraw canvas
-        self.draw_bins()
-        self.update_stats_sync()
-        
-        return f"Successfully placed item {item_id} in bin {bin_id}"
+                       width: float, height: float, shape: str, item_type: str,
+                       refresh: bool = True):
+        """Place an item synchronously (called from main thread); refresh=False defers drawing"""
+        new_item, result = self.model.try_place(item_id, bin_id, x, y, width, height, shape, item_type)
+        if new_item is None:
+            return result
+        canvas_item = self.make_canvas_item(new_item)
+        self.drawn_items[bin_id].append(canvas_item)
+        
+        # Only the new item needs drawing; bin frames and earlier items stay on the canvas
+        self.pending_items.append(canvas_item)
+        self.stats_dirty = True
+        if refresh:
+            self.refresh()
+        
+        return result
+    
+    def play_plan(self, plan: List[Dict[str, Any]], step_ms: int = 16, batch_size: int = 1):
+        """Replay a packing plan on the Tk event loop, batch_size placements per step"""
+        if not plan:
+            return
+        # Give the window a moment to paint before the first placement
+        self.root.after(100, self.play_step, plan, 0, step_ms, batch_size, [])
+    
+    def play_step(self, plan: List[Dict[str, Any]], start: int, step_ms: int,
+                  batch_size: int, log: List[str]):
+        """Place the next batch of plan steps and schedule the following one"""
+        total = len(plan)
+        end = min(start + batch_size, total)
+        
+        for i in range(start, end):
+            step = plan[i]
+            log.append(f"Placing item {i+1}/{total}: {step['item_type']} in Bin {step['bin_id']}")
+            
+            # Runs on the Tk thread, so place directly without the command
+            # queue; drawing waits until the whole batch is placed
+            result = self.place_item_sync(
+                step['item_id'],
+                step['bin_id'],
+                step['x'],
+                step['y'],
+                step['width'],
+                step['height'],
+                step['shape'],
+                step['item_type'],
+                refresh=False
+            )
+            
+            if "Error" in result:
+                log.append(f"   ❌ {result}")
+            else:
+                log.append(f"   ✅ {result}")
+            
+            # Write status lines in chunks rather than once per line
+            if (i + 1) % LOG_FLUSH_STEPS == 0:
+                flush_log(log)
+        
+        # One redraw per batch
+        self.refresh()
+        
+        if end < total:
+            self.root.after(step_ms, self.play_step, plan, end, step_ms, batch_size, log)
+        else:
+            flush_log(log)
+            print("🎉 Simulation completed!")
     
-    def items_overlap(self, item1: PlacedItem, item2: PlacedItem) -> bool:
-        """Check if two items overlap"""
-        return not (item1.x + item1.width <= item2.x or 
-                   item2.x + item2.width <= item1.x or
-                   item1.y + item1.height <= item2.y or 
-                   item2.y + item2.height <= item1.y)
+    def make_canvas_item(self, item: PlacedItem) -> CanvasItem:
+        """Compute a placed item's scaled canvas coordinates and fill color"""
+        scale = self.scale
+        sx1 = self.bin_x_offsets[item.bin_id] + item.x * scale
+        sy1 = self.padding + item.y * scale
+        sx2 = sx1 + item.width * scale
+        sy2 = sy1 + item.height * scale
+        return CanvasItem(item.item_id, item.shape, sx1, sy1, sx2, sy2,
+                          (sx1 + sx2) // 2, (sy1 + sy2) // 2,
+                          self.colors.get(item.item_type, "gray"))
     
     def reset_simulation(self) -> str:
         """Reset the simulation (thread-safe)"""
         command = {"type": "reset"}
-        self.command_queue.put(command)
+        self.queue_command(command)
         return "Simulation reset"
     
-    def reset_simulation_sync(self):
+    def reset_simulation_sync(self, refresh: bool = True):
         """Reset simulation synchronously"""
-        for bin_data in self.bins.values():
-            bin_data["items"].clear()
-        self.draw_bins()
-        self.update_stats_sync()
-    
-    def get_simulation_state(self) -> Dict[str, Any]:
-        """Get current simulation state"""
-        state = {
-            "bins": {},
-            "total_items": 0,
-            "total_utilization": 0.0
-        }
-        
-        for bin_id, bin_data in self.bins.items():
-            items = bin_data["items"]
-            used_area = sum(item.width * item.height for item in items)
-            total_area = bin_data["width"] * bin_data["height"]
-            utilization = (used_area / total_area * 100) if total_area > 0 else 0
-            
-            state["bins"][bin_id] = {
-                "width": bin_data["width"],
-                "height": bin_data["height"],
-                "items": [
-                    {
-                        "item_id": item.item_id,
-                        "item_type": item.item_type,
-                        "x": item.x,
-                        "y": item.y,
-                        "width": item.width,
-                        "height": item.height,
-                        "shape": item.shape
-                    }
-                    for item in items
-                ],
-                "utilization": utilization
-            }
-            state["total_items"] += len(items)
-            state["total_utilization"] += utilization
-        
-        state["total_utilization"] /= len(self.bins)
-        return state
+        self.model.reset()
+        for items in self.drawn_items:
+            items.clear()
+        self.pending_items.clear()
+        self.clear_items()
+        self.present()
+        self.stats_dirty = True
+        if refresh:
+            self.refresh()
     
     def update_stats_sync(self):
         """Update statistics display"""
-        state = self.get_simulation_state()
-        
-        stats_text = "SIMULATION STATISTICS\n"
-        stats_text += "=" * 50 + "\n\n"
+        self.stats_dirty = False
+        self.stats_scheduled = False
+        state = self.model.get_summary()
         
         for bin_id, bin_data in state["bins"].items():
-            stats_text += f"Bin {bin_id} ({bin_data['width']}x{bin_data['height']}):\n"
-            stats_text += f"  Items: {len(bin_data['items'])}\n"
-            stats_text += f"  Utilization: {bin_data['utilization']:.1f}%\n"
-            stats_text += f"  Item types: {', '.join(set(item['item_type'] for item in bin_data['items']))}\n\n"
-        
-        stats_text += f"Total Items: {state['total_items']}\n"
-        stats_text += f"Average Utilization: {state['total_utilization']:.1f}%\n"
+            self.stats_vars[bin_id].set(
+                f"Bin {bin_id} ({bin_data['width']}x{bin_data['height']}): "
+                f"{bin_data['item_count']} items, {bin_data['utilization']:.1f}% | "
+                f"Types: {', '.join(bin_data['item_types'])}"
+            )
         
-        self.stats_text.delete(1.0, tk.END)
-        self.stats_text.insert(1.0, stats_text)
+        self.stats_vars["total"].set(
+            f"Total: {state['total_items']} items, {state['total_utilization']:.1f}% average utilization"
+        )
     
-    def print_state(self):
-        """Print current state to console"""
-        state = self.get_simulation_state()
+    def print_state(self, verbose: bool = False):
+        """Print current state to console; compact JSON unless verbose"""
+        state = self.model.get_full_state()
         print("Current Simulation State:")
-        print(json.dumps(state, indent=2))
+        if verbose:
+            print(json.dumps(state, indent=2))
+        else:
+            json.dump(state, sys.stdout, separators=(',', ':'))
+            sys.stdout.write('\n')
     
     def run(self):
         """Start the simulation GUI"""
@@ -0,0 +1,190 @@
+"""
+Bin packing simulation state and placement rules, independent of the GUI
+"""
+from array import array
+from collections import Counter
+from dataclasses import dataclass
+from typing import Dict, Any, Optional, Tuple
+import numpy as np
+from simulation.packing_numba import any_overlap
+from simulation.quadtree import QuadNode
+
+# Per-bin coordinate arrays (structure of arrays) used for overlap checks and utilization
+GEOMETRY_KEYS = ("xs", "ys", "ws", "hs")
+INITIAL_CAPACITY = 64
+
+
+@dataclass(slots=True)
+class PlacedItem:
+    item_id: int
+    item_type: str
+    bin_id: int
+    x: float
+    y: float
+    width: float
+    height: float
+    shape: str
+
+
+class BinPackingModel:
+    def __init__(self):
+        # Bins are indexed by bin id; placed items are stored per bin as
+        # parallel columns (see reset_geometry) rather than as item objects
+        self.bins = [
+            {"width": 220, "height": 220},
+            {"width": 180, "height": 200},
+            {"width": 200, "height": 180},
+            {"width": 160, "height": 160}
+        ]
+        for bin_data in self.bins:
+            bin_data["total_area"] = bin_data["width"] * bin_data["height"]
+            self.reset_geometry(bin_data)
+        self.inv_bin_count = 1.0 / len(self.bins)
+
+    def try_place(self, item_id: int, bin_id: int, x: float, y: float,
+                  width: float, height: float, shape: str, item_type: str) -> Tuple[Optional[PlacedItem], str]:
+        """Place an item if it fits; returns the placed item (None on failure) and a status message"""
+        if not 0 <= bin_id < len(self.bins):
+            return None, f"Error: Bin {bin_id} does not exist"
+
+        # Check if item fits in bin
+        bin_data = self.bins[bin_id]
+        if x + width > bin_data["width"] or y + height > bin_data["height"]:
+            return None, f"Error: Item {item_id} does not fit in bin {bin_id}"
+
+        # Narrow the overlap check to items near the new one, then test those exactly
+        bbox = (x, y, x + width, y + height)
+        candidates = np.array(bin_data["index"].intersects(bbox), dtype=np.int64)
+        overlap = any_overlap(float(x), float(y), float(width), float(height),
+                              bin_data["xs"], bin_data["ys"], bin_data["ws"], bin_data["hs"], candidates)
+        if overlap != -1:
+            return None, f"Error: Item {item_id} overlaps with existing item {bin_data['ids'][overlap]}"
+
+        # Add item to bin
+        new_item = PlacedItem(item_id, item_type, bin_id, x, y, width, height, shape)
+        self.append_item(bin_data, new_item)
+        bin_data["index"].insert(bbox, bin_data["count"] - 1)
+
+        return new_item, f"Successfully placed item {item_id} in bin {bin_id}"
+
+    def place_item_sync(self, item_id: int, bin_id: int, x: float, y: float,
+                        width: float, height: float, shape: str, item_type: str) -> str:
+        """Place an item and return the status message"""
+        return self.try_place(item_id, bin_id, x, y, width, height, shape, item_type)[1]
+
+    def append_item(self, bin_data: Dict[str, Any], item: PlacedItem):
+        """Append an item to the bin's columns, doubling the coordinate arrays when full"""
+        n = bin_data["count"]
+        if n == bin_data["xs"].shape[0]:
+            for key in GEOMETRY_KEYS:
+                grown = np.empty(2 * n, dtype=np.float64)
+                grown[:n] = bin_data[key]
+                bin_data[key] = grown
+        bin_data["xs"][n] = item.x
+        bin_data["ys"][n] = item.y
+        bin_data["ws"][n] = item.width
+        bin_data["hs"][n] = item.height
+        bin_data["ids"].append(item.item_id)
+        bin_data["types"].append(item.item_type)
+        bin_data["shapes"].append(item.shape)
+        bin_data["count"] = n + 1
+
+        # Running totals read by the statistics display
+        bin_data["type_counts"][item.item_type] += 1
+        bin_data["used_area"] += item.width * item.height
+
+    def find_item_at(self, bin_id: int, x: float, y: float) -> Optional[int]:
+        """Get the index of the item covering a point in a bin, or None"""
+        bin_data = self.bins[bin_id]
+        xs, ys, ws, hs = bin_data["xs"], bin_data["ys"], bin_data["ws"], bin_data["hs"]
+        for i in bin_data["index"].intersects((x, y, x, y)):
+            if xs[i] <= x <= xs[i] + ws[i] and ys[i] <= y <= ys[i] + hs[i]:
+                return i
+        return None
+
+    def reset_geometry(self, bin_data: Dict[str, Any]):
+        """Clear the bin's item columns and the spatial index used for overlap checks"""
+        for key in GEOMETRY_KEYS:
+            bin_data[key] = np.empty(INITIAL_CAPACITY, dtype=np.float64)
+        bin_data["ids"] = array('i')
+        bin_data["types"] = []
+        bin_data["shapes"] = []
+        bin_data["count"] = 0
+        bin_data["type_counts"] = Counter()
+        bin_data["used_area"] = 0.0
+        bin_data["index"] = QuadNode((0, 0, bin_data["width"], bin_data["height"]))
+
+    def reset(self):
+        """Remove every placed item from every bin"""
+        for bin_data in self.bins:
+            self.reset_geometry(bin_data)
+
+    def bin_utilization(self, bin_data: Dict[str, Any]) -> float:
+        """Get a bin's utilization percentage from its running used area"""
+        total_area = bin_data["total_area"]
+        if total_area <= 0:
+            return 0
+        return bin_data["used_area"] / total_area * 100
+
+    def get_summary(self) -> Dict[str, Any]:
+        """Get per-bin counts and utilization without the placed item details"""
+        summary = {
+            "bins": {},
+            "total_items": 0,
+            "total_utilization": 0.0
+        }
+
+        for bin_id, bin_data in enumerate(self.bins):
+            utilization = self.bin_utilization(bin_data)
+            summary["bins"][bin_id] = {
+                "width": bin_data["width"],
+                "height": bin_data["height"],
+                "item_count": bin_data["count"],
+                "item_types": list(bin_data["type_counts"]),
+                "utilization": utilization
+            }
+            summary["total_items"] += bin_data["count"]
+            summary["total_utilization"] += utilization
+
+        summary["total_utilization"] *= self.inv_bin_count
+        return summary
+
+    def get_full_state(self) -> Dict[str, Any]:
+        """Get current simulation state including every placed item"""
+        state = {
+            "bins": {},
+            "total_items": 0,
+            "total_utilization": 0.0
+        }
+
+        for bin_id, bin_data in enumerate(self.bins):
+            n = bin_data["count"]
+            utilization = self.bin_utilization(bin_data)
+
+            # Item dicts are only built here, by zipping the bin's columns
+            columns = zip(bin_data["ids"], bin_data["types"],
+                          bin_data["xs"][:n].tolist(), bin_data["ys"][:n].tolist(),
+                          bin_data["ws"][:n].tolist(), bin_data["hs"][:n].tolist(),
+                          bin_data["shapes"])
+            state["bins"][bin_id] = {
+                "width": bin_data["width"],
+                "height": bin_data["height"],
+                "items": [
+                    {
+                        "item_id": item_id,
+                        "item_type": item_type,
+                        "x": x,
+                        "y": y,
+                        "width": width,
+                        "height": height,
+                        "shape": shape
+                    }
+                    for item_id, item_type, x, y, width, height, shape in columns
+                ],
+                "utilization": utilization
+            }
+            state["total_items"] += n
+            state["total_utilization"] += utilization
+
+        state["total_utilization"] *= self.inv_bin_count
+        return state
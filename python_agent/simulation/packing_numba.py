@@ -0,0 +1,20 @@
+"""
+Numba-compiled geometry helpers for the bin packing simulation
+"""
+import numpy as np
+from numba import njit
+
+
+# Explicit signature so the function is compiled (or loaded from the on-disk
+# cache) at import instead of on the first placement
+@njit("int64(float64, float64, float64, float64, float64[:], float64[:], float64[:], float64[:], int64[:])",
+      cache=True)
+def any_overlap(x: float, y: float, w: float, h: float,
+                xs: np.ndarray, ys: np.ndarray, ws: np.ndarray, hs: np.ndarray,
+                candidates: np.ndarray) -> int:
+    """Return the first candidate index whose rectangle overlaps (x, y, w, h), or -1"""
+    for i in candidates:
+        if not (x + w <= xs[i] or xs[i] + ws[i] <= x or
+                y + h <= ys[i] or ys[i] + hs[i] <= y):
+            return i
+    return -1
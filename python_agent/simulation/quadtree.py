@@ -0,0 +1,82 @@
+"""
+Minimal quadtree for looking up placed items by bounding box
+"""
+from typing import Any, List, Optional, Tuple
+
+# Axis-aligned bounding box as (x1, y1, x2, y2)
+BBox = Tuple[float, float, float, float]
+
+
+def _intersects(a: BBox, b: BBox) -> bool:
+    """Check if two boxes intersect or touch (conservative, for candidate search)"""
+    return a[0] <= b[2] and b[0] <= a[2] and a[1] <= b[3] and b[1] <= a[3]
+
+
+def _contains(outer: BBox, inner: BBox) -> bool:
+    """Check if a box lies completely inside another"""
+    return outer[0] <= inner[0] and outer[1] <= inner[1] and inner[2] <= outer[2] and inner[3] <= outer[3]
+
+
+class QuadNode:
+    """Quadtree node; splits into four children once it holds more than max_items entries"""
+
+    __slots__ = ("bbox", "items", "children", "max_items", "depth")
+
+    MAX_DEPTH = 8
+
+    def __init__(self, bbox: BBox, max_items: int = 8, depth: int = 0):
+        self.bbox = bbox
+        self.items: List[Tuple[BBox, Any]] = []
+        self.children: Optional[List["QuadNode"]] = None
+        self.max_items = max_items
+        self.depth = depth
+
+    def insert(self, bbox: BBox, value: Any):
+        """Insert a value under its bounding box"""
+        if self.children is not None:
+            child = self._child_containing(bbox)
+            if child is not None:
+                child.insert(bbox, value)
+                return
+
+        self.items.append((bbox, value))
+
+        if self.children is None and len(self.items) > self.max_items and self.depth < self.MAX_DEPTH:
+            self._split()
+
+    def intersects(self, bbox: BBox) -> List[Any]:
+        """Get the values whose bounding boxes intersect or touch the given box"""
+        found = []
+        stack = [self]
+        while stack:
+            node = stack.pop()
+            for item_bbox, value in node.items:
+                if _intersects(item_bbox, bbox):
+                    found.append(value)
+            if node.children is not None:
+                stack.extend(child for child in node.children if _intersects(child.bbox, bbox))
+        return found
+
+    def _child_containing(self, bbox: BBox) -> Optional["QuadNode"]:
+        """Get the child that fully contains a box, if any"""
+        for child in self.children:
+            if _contains(child.bbox, bbox):
+                return child
+        return None
+
+    def _split(self):
+        """Create four children and push down the entries that fit in one"""
+        x1, y1, x2, y2 = self.bbox
+        mid_x = (x1 + x2) / 2
+        mid_y = (y1 + y2) / 2
+        depth = self.depth + 1
+        self.children = [
+            QuadNode((x1, y1, mid_x, mid_y), self.max_items, depth),
+            QuadNode((mid_x, y1, x2, mid_y), self.max_items, depth),
+            QuadNode((x1, mid_y, mid_x, y2), self.max_items, depth),
+            QuadNode((mid_x, mid_y, x2, y2), self.max_items, depth)
+        ]
+
+        items, self.items = self.items, []
+        for bbox, value in items:
+            self.insert(bbox, value)
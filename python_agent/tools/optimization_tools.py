@@ -14,16 +14,16 @@ Architecture:
 
 The tools return simple strings instead of complex objects to ensure API compatibility.
 """
+import asyncio
 import json
 import subprocess
-import tempfile
 import os
 import threading
 import time
-from typing import Dict, Any, List, Optional, TypedDict
+from typing import Dict, Any, List, Optional, Tuple, TypedDict
 from agents import function_tool, RunContextWrapper
-from simulation.gui import BinPackingSimulation
 from utils.item_generator import generate_full_230_items, generate_standard_bins, print_item_distribution
+from utils.java_runner import build_java_command
 from results_storage import save_optimization_result, load_optimization_result
 
 
@@ -33,6 +33,102 @@ class ItemsConfig(TypedDict, total=False):
     bins: List[Dict[str, Any]]
 
 
+# Project root containing pom.xml, resolved once at import
+_PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+# Maximum number of Java optimizations allowed to run at the same time
+MAX_CONCURRENT_OPTIMIZATIONS = 4
+_optimization_slots = threading.BoundedSemaphore(MAX_CONCURRENT_OPTIMIZATIONS)
+
+# Wall-clock limit for a single Java optimization run, in seconds
+JAVA_TIMEOUT_SECONDS = 300
+
+
+# Shared decoder for pulling the result object out of the GA output
+_JSON_DECODER = json.JSONDecoder()
+
+
+def _extract_json(text: str) -> Dict[str, Any]:
+    """
+    Find and decode the first complete JSON object in the GA output.
+    
+    Args:
+        text: Captured stdout, which may contain log lines around the JSON
+        
+    Returns:
+        The decoded optimization result
+        
+    Raises:
+        RuntimeError: If the output contains no complete JSON object
+    """
+    idx = text.find('{')
+    if idx == -1:
+        error_msg = "No JSON output found!"
+        print(f"❌ {error_msg}")
+        raise RuntimeError(error_msg)
+    
+    while idx != -1:
+        try:
+            obj, _ = _JSON_DECODER.raw_decode(text, idx)
+            return obj
+        except json.JSONDecodeError:
+            idx = text.find('{', idx + 1)
+    
+    error_msg = "Incomplete JSON output found!"
+    print(f"❌ {error_msg}")
+    raise RuntimeError(error_msg)
+
+
+def _write_input(stdin, input_data: Dict[str, Any]):
+    """Send the GA input as compact JSON and close stdin so Java sees EOF"""
+    try:
+        json.dump(input_data, stdin, default=dict)
+        stdin.close()
+    except (BrokenPipeError, ConnectionResetError):
+        # Java exited before reading everything; the stdout side reports why
+        pass
+
+
+def _stream_json(stdout) -> Tuple[Optional[Dict[str, Any]], str]:
+    """
+    Read GA output line by line until the first complete JSON object arrives.
+    
+    Log lines before the JSON are discarded as they are read. Once a line
+    starts with '{', lines are buffered and a decode is attempted whenever
+    the running brace count closes. A failed decode drops that candidate
+    and waits for the next line starting with '{', so braces inside strings
+    cannot trigger a decode of the whole buffer on every following line.
+    
+    Args:
+        stdout: Text stream of the Java process
+        
+    Returns:
+        Tuple of (decoded result or None, buffered text from the JSON start)
+    """
+    lines = []
+    start = None
+    depth = 0
+    
+    for line in stdout:
+        if start is None:
+            if not line.lstrip().startswith('{'):
+                if lines:
+                    lines.append(line)
+                continue
+            start = len(lines)
+            depth = 0
+        
+        lines.append(line)
+        depth += line.count('{') - line.count('}')
+        if depth <= 0:
+            text = ''.join(lines[start:])
+            try:
+                obj, _ = _JSON_DECODER.raw_decode(text, text.index('{'))
+                return obj, text
+            except json.JSONDecodeError:
+                start = None
+    
+    return None, ''.join(lines)
 
 
 def optimization_error_handler(context: RunContextWrapper[Any], error: Exception) -> str:
@@ -48,7 +144,7 @@ def simulation_error_handler(context: RunContextWrapper[Any], error: Exception)
 
 
 @function_tool(failure_error_function=optimization_error_handler, strict_mode=False)
-def optimize_bin_packing(items_config: Optional[ItemsConfig] = None) -> str:
+async def optimize_bin_packing(items_config: Optional[ItemsConfig] = None) -> str:
     """
     Run Java genetic algorithm optimization to find the best bin packing solution.
     
@@ -63,6 +159,28 @@ def optimize_bin_packing(items_config: Optional[ItemsConfig] = None) -> str:
     Returns:
         String containing the result file path for the simulation tool to use.
     """
+    # The Java run blocks on a subprocess, so keep it off the event loop
+    # and let independent tool calls from the same turn overlap
+    return await asyncio.to_thread(_run_limited, items_config)
+
+
+def _run_limited(items_config: Optional[ItemsConfig]) -> str:
+    """Run an optimization once a concurrency slot is free"""
+    with _optimization_slots:
+        return run_optimization(items_config)
+
+
+def run_optimization(items_config: Optional[ItemsConfig] = None) -> str:
+    """
+    Run the Java genetic algorithm and save the result to a file.
+    
+    Args:
+        items_config: Optional custom items and bins configuration.
+                     If None, uses the default 230 items configuration.
+                     
+    Returns:
+        Path to the saved optimization result file
+    """
     print("🔍 Running Java optimization...")
     
     # Use provided config or generate default
@@ -78,95 +196,73 @@ def optimize_bin_packing(items_config: Optional[ItemsConfig] = None) -> str:
     input_data = {"items": items, "bins": bins}
     
     try:
-        # Write to temporary file
-        with tempfile.NamedTemporaryFile(mode='w', suffix='.json', delete=False) as temp_file:
-            json.dump(input_data, temp_file, indent=2)
-            temp_file_path = temp_file.name
+        # Run Java GA optimization, feeding the input over stdin
+        cmd = build_java_command(["--input", "-", "--headless"])
+        
+        print(f"📦 Optimizing {len(items)} items...")
+        proc = subprocess.Popen(
+            cmd,
+            cwd=_PROJECT_ROOT,
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE,
+            text=True,
+            bufsize=1
+        )
+        
+        # Write the input and drain stderr in the background so neither pipe
+        # can block the stdout reader, and kill the run if it passes the
+        # wall-clock limit
+        stdin_writer = threading.Thread(target=_write_input, args=(proc.stdin, input_data), daemon=True)
+        stdin_writer.start()
+        stderr_chunks = []
+        stderr_reader = threading.Thread(target=lambda: stderr_chunks.append(proc.stderr.read()), daemon=True)
+        stderr_reader.start()
+        deadline = time.monotonic() + JAVA_TIMEOUT_SECONDS
+        watchdog = threading.Timer(JAVA_TIMEOUT_SECONDS, proc.kill)
+        watchdog.start()
         
         try:
-            # Get the project root directory
-            project_root = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
-            
-            # Run Java GA optimization
-            cmd = [
-                "mvn", "exec:java", 
-                f"-Dexec.args=--input {temp_file_path} --headless"
-            ]
-            
-            print(f"📦 Optimizing {len(items)} items...")
-            result = subprocess.run(
-                cmd,
-                cwd=project_root,
-                capture_output=True,
-                text=True,
-                timeout=300
-            )
-            
-            if result.returncode != 0:
-                error_msg = f"Java optimization failed: {result.stderr}"
-                print(f"❌ {error_msg}")
-                raise RuntimeError(error_msg)
-            
-            # Parse JSON output
-            output_lines = result.stdout.split('\n')
-            json_start = -1
-            json_end = -1
-            
-            # Find the first complete JSON object
-            for i, line in enumerate(output_lines):
-                if line.strip().startswith('{'):
-                    json_start = i
-                    break
-            
-            if json_start == -1:
-                error_msg = "No JSON output found!"
-                print(f"❌ {error_msg}")
-                raise RuntimeError(error_msg)
-            
-            # Find where the JSON ends
-            brace_count = 0
-            for i in range(json_start, len(output_lines)):
-                line = output_lines[i]
-                for char in line:
-                    if char == '{':
-                        brace_count += 1
-                    elif char == '}':
-                        brace_count -= 1
-                        if brace_count == 0:
-                            json_end = i + 1
-                            break
-                if json_end != -1:
-                    break
+            optimization_result, json_text = _stream_json(proc.stdout)
+        finally:
+            watchdog.cancel()
+            # Anything Java prints after the result is not needed
+            if proc.poll() is None:
+                proc.kill()
+            proc.wait()
+            stdin_writer.join()
+            stderr_reader.join()
+        
+        if optimization_result is None:
+            if time.monotonic() >= deadline:
+                raise RuntimeError(f"Java optimization timed out after {JAVA_TIMEOUT_SECONDS}s")
             
-            if json_end == -1:
-                error_msg = "Incomplete JSON output found!"
+            if proc.returncode != 0:
+                error_msg = f"Java optimization failed: {''.join(stderr_chunks)}"
                 print(f"❌ {error_msg}")
                 raise RuntimeError(error_msg)
             
-            # Extract JSON part
-            json_output = '\n'.join(output_lines[json_start:json_end])
-            optimization_result = json.loads(json_output)
-            
-            print("✅ Optimization completed!")
-            print(f"   Fitness: {optimization_result.get('fitness', 'N/A'):.2f}")
-            print(f"   Packed Value: ${optimization_result.get('packed_value', 'N/A'):,.2f}")
-            print(f"   Items Placed: {len(optimization_result.get('plan', []))}")
-            
-            # Save full result to file and return simplified metadata
-            try:
-                result_file_path = save_optimization_result(optimization_result)
-                print(f"💾 Results saved to: {result_file_path}")
-                
-                # Return only the file path as a string
-                return str(result_file_path)
-            except Exception as e:
-                print(f"⚠️ Warning: Could not save results to file: {e}")
-                # Fallback to returning full result if file save fails
-                raise RuntimeError(f"Failed to save optimization results: {e}")
-            
-        finally:
-            os.unlink(temp_file_path)
+            # The brace count can be thrown off by braces inside strings,
+            # so fall back to scanning the buffered text
+            optimization_result = _extract_json(json_text)
+        
+        print("✅ Optimization completed!")
+        print(f"   Fitness: {optimization_result.get('fitness', 'N/A'):.2f}")
+        print(f"   Packed Value: ${optimization_result.get('packed_value', 'N/A'):,.2f}")
+        print(f"   Items Placed: {len(optimization_result.get('plan', []))}")
+        
+        # Save full result to file and return simplified metadata
+        try:
+            result_file_path = save_optimization_result(optimization_result)
+            print(f"💾 Results saved to: {result_file_path}")
             
+            # Return only the file path as a string
+            return str(result_file_path)
+        except Exception as e:
+            print(f"⚠️ Warning: Could not save results to file: {e}")
+            # Fallback to returning full result if file save fails
+            raise RuntimeError(f"Failed to save optimization results: {e}")
+
     except Exception as e:
         error_msg = f"Error during optimization: {e}"
         print(f"❌ {error_msg}")
@@ -204,41 +300,16 @@ def simulate_bin_packing(result_file_path: str) -> str:
     
     print("🎯 Starting simulation...")
     
+    # Kept synchronous on purpose: Tk has to own the main thread, so the
+    # GUI runs on the event loop thread until the window is closed
     try:
-        # Create simulation GUI
+        # Create simulation GUI (Tk is only loaded when a simulation runs)
+        from simulation.gui import BinPackingSimulation
         sim = BinPackingSimulation()
         
-        # Start simulation in a separate thread
-        def run_simulation():
-            for i, step in enumerate(packing_plan):
-                print(f"Placing item {i+1}/{len(packing_plan)}: {step['item_type']} in Bin {step['bin_id']}")
-                
-                # Place the item
-                result = sim.place_item(
-                    step['item_id'],
-                    step['bin_id'],
-                    step['x'],
-                    step['y'],
-                    step['width'],
-                    step['height'],
-                    step['shape'],
-                    step['item_type']
-                )
-                
-                if "Error" in result:
-                    print(f"   ❌ {result}")
-                else:
-                    print(f"   ✅ {result}")
-                
-                # Small delay for visual effect
-                time.sleep(0.1)
-            
-            print("🎉 Simulation completed!")
-        
-        # Start simulation thread
-        sim_thread = threading.Thread(target=run_simulation)
-        sim_thread.daemon = True
-        sim_thread.start()
+        # Replay the plan from Tk's own event loop; no producer thread
+        # competes with the GUI for the GIL
+        sim.play_plan(packing_plan)
         
         # Run GUI (this will block until window is closed)
         sim.run()
@@ -2,128 +2,85 @@
 """
 Utility functions for generating item configurations
 """
-from typing import List, Dict, Any
+import functools
+from collections import Counter
+from operator import itemgetter
+from types import MappingProxyType
+from typing import List, Dict, Any, Mapping, Sequence, Tuple
 
 
-def generate_full_230_items() -> List[Dict[str, Any]]:
+# Item types in the Java configuration: (type, width, height, shape, price, count)
+ITEM_SPECS = [
+    # Rectangles
+    ("Rectangle A", 50, 50, "RECTANGLE", 100, 15),
+    ("Rectangle B", 35, 45, "RECTANGLE", 150, 25),
+    ("Rectangle C", 25, 30, "RECTANGLE", 70, 40),
+    ("Rectangle D", 30, 40, "RECTANGLE", 300, 60),
+    # Triangles
+    ("Triangle Small", 30, 30, "TRIANGLE", 120, 30),
+    ("Triangle Large", 45, 45, "TRIANGLE", 180, 20),
+    # Circles
+    ("Circle Small", 30, 30, "CIRCLE", 90, 25),
+    ("Circle Medium", 40, 40, "CIRCLE", 200, 15)
+]
+
+
+@functools.lru_cache(maxsize=1)
+def generate_full_230_items() -> Tuple[Mapping[str, Any], ...]:
     """
     Generate the complete 230-item configuration matching the Java code.
     
+    The configuration is built once and cached, so it is returned as
+    read-only mappings; serialize with `default=dict`.
+    
     Returns:
-        List of 230 items with all types and sizes from the Java configuration
+        Tuple of 230 items with all types and sizes from the Java configuration
     """
     items = []
-    item_id_counter = 0
-    
-    # Rectangles
-    for i in range(15):
-        items.append({
-            "id": item_id_counter, 
-            "type": "Rectangle A", 
-            "width": 50, 
-            "height": 50, 
-            "shape": "RECTANGLE", 
-            "price": 100
-        })
-        item_id_counter += 1
-    
-    for i in range(25):
-        items.append({
-            "id": item_id_counter, 
-            "type": "Rectangle B", 
-            "width": 35, 
-            "height": 45, 
-            "shape": "RECTANGLE", 
-            "price": 150
-        })
-        item_id_counter += 1
-    
-    for i in range(40):
-        items.append({
-            "id": item_id_counter, 
-            "type": "Rectangle C", 
-            "width": 25, 
-            "height": 30, 
-            "shape": "RECTANGLE", 
-            "price": 70
-        })
-        item_id_counter += 1
-    
-    for i in range(60):
-        items.append({
-            "id": item_id_counter, 
-            "type": "Rectangle D", 
-            "width": 30, 
-            "height": 40, 
-            "shape": "RECTANGLE", 
-            "price": 300
-        })
-        item_id_counter += 1
-    
-    # Triangles
-    for i in range(30):
-        items.append({
-            "id": item_id_counter, 
-            "type": "Triangle Small", 
-            "width": 30, 
-            "height": 30, 
-            "shape": "TRIANGLE", 
-            "price": 120
-        })
-        item_id_counter += 1
-    
-    for i in range(20):
-        items.append({
-            "id": item_id_counter, 
-            "type": "Triangle Large", 
-            "width": 45, 
-            "height": 45, 
-            "shape": "TRIANGLE", 
-            "price": 180
-        })
-        item_id_counter += 1
-    
-    # Circles
-    for i in range(25):
-        items.append({
-            "id": item_id_counter, 
-            "type": "Circle Small", 
-            "width": 30, 
-            "height": 30, 
-            "shape": "CIRCLE", 
-            "price": 90
-        })
-        item_id_counter += 1
-    
-    for i in range(15):
-        items.append({
-            "id": item_id_counter, 
-            "type": "Circle Medium", 
-            "width": 40, 
-            "height": 40, 
-            "shape": "CIRCLE", 
-            "price": 200
-        })
-        item_id_counter += 1
-    
-    return items
+    for item_type, width, height, shape, price, count in ITEM_SPECS:
+        first_id = len(items)
+        items.extend(
+            MappingProxyType({"id": first_id + k, "type": item_type, "width": width, "height": height,
+                              "shape": shape, "price": price})
+            for k in range(count)
+        )
+    return tuple(items)
 
 
-def generate_standard_bins() -> List[Dict[str, Any]]:
+def generate_items(num_items: int) -> List[Dict[str, Any]]:
     """
-    Generate the standard 4-bin configuration.
+    Generate a given number of items with the same type mix as the 230-item configuration.
     
+    Args:
+        num_items: Number of items to generate
+        
     Returns:
-        List of 4 bins with standard sizes
+        List of items sampled evenly across the full configuration, with ids 0..num_items-1
     """
+    full_items = generate_full_230_items()
+    stride = len(full_items) / num_items if num_items > 0 else 0
     return [
-        {"id": 0, "width": 220, "height": 220},
-        {"id": 1, "width": 180, "height": 200},
-        {"id": 2, "width": 200, "height": 180},
-        {"id": 3, "width": 160, "height": 160}
+        {**full_items[int(i * stride) % len(full_items)], "id": i}
+        for i in range(num_items)
     ]
 
 
+@functools.lru_cache(maxsize=1)
+def generate_standard_bins() -> Tuple[Mapping[str, Any], ...]:
+    """
+    Generate the standard 4-bin configuration.
+    
+    Returns:
+        Cached tuple of 4 read-only bins with standard sizes
+    """
+    return (
+        MappingProxyType({"id": 0, "width": 220, "height": 220}),
+        MappingProxyType({"id": 1, "width": 180, "height": 200}),
+        MappingProxyType({"id": 2, "width": 200, "height": 180}),
+        MappingProxyType({"id": 3, "width": 160, "height": 160})
+    )
+
+
 def generate_sample_items() -> List[Dict[str, Any]]:
     """
     Generate a small sample of items for quick testing.
@@ -141,26 +98,20 @@ def generate_sample_items() -> List[Dict[str, Any]]:
     ]
 
 
-def print_item_distribution(items: List[Dict[str, Any]]) -> None:
+def print_item_distribution(items: Sequence[Mapping[str, Any]]) -> None:
     """
     Print a summary of item distribution.
     
     Args:
         items: List of items to analyze
     """
-    item_counts = {}
-    total_value = 0
-    
-    for item in items:
-        item_type = item['type']
-        item_counts[item_type] = item_counts.get(item_type, 0) + 1
-        total_value += item['price']
+    item_counts = Counter(map(itemgetter('type'), items))
+    total_value = sum(map(itemgetter('price'), items))
     
-    print(f"📦 Total Items: {len(items)}")
-    print("📊 Item Distribution:")
-    for item_type, count in item_counts.items():
-        print(f"   {item_type}: {count} items")
-    print(f"💰 Total Value: ${total_value:,.2f}")
+    lines = [f"📦 Total Items: {len(items)}", "📊 Item Distribution:"]
+    lines.extend(f"   {item_type}: {count} items" for item_type, count in item_counts.items())
+    lines.append(f"💰 Total Value: ${total_value:,.2f}")
+    print("\n".join(lines))
 
 
 if __name__ == "__main__":
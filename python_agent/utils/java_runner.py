@@ -0,0 +1,112 @@
+#!/usr/bin/env python3
+"""
+Utility functions for launching the Java genetic algorithm
+"""
+import os
+import shutil
+import subprocess
+import threading
+from typing import List, Optional
+
+
+# Project root containing pom.xml
+_PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+_CLASSES_DIR = os.path.join(_PROJECT_ROOT, "target", "classes")
+_CLASSPATH_FILE = os.path.join(_PROJECT_ROOT, "target", "classpath.txt")
+_MAIN_CLASS = "Code2"
+
+# Executables looked up on PATH once at import
+_MVN = shutil.which("mvn")
+_JAVA = shutil.which("java")
+
+# Classpath resolved once per process; the lock keeps concurrent callers
+# from running Maven at the same time
+_classpath: Optional[str] = None
+_classpath_resolved = False
+_classpath_lock = threading.Lock()
+
+
+def check_java_tools() -> None:
+    """
+    Fail fast when the tools needed to run the GA are missing.
+
+    Raises:
+        RuntimeError: If Maven cannot be found on PATH
+    """
+    if _MVN is None:
+        raise RuntimeError("Maven not found: install Maven and make sure 'mvn' is on PATH")
+
+
+def resolve_classpath() -> Optional[str]:
+    """
+    Compile the Java project and resolve its runtime classpath once per process.
+
+    Returns:
+        Classpath string for launching the GA with plain `java`, or None if
+        Maven could not resolve it (callers fall back to `mvn compile exec:java`)
+    """
+    global _classpath, _classpath_resolved
+    with _classpath_lock:
+        if not _classpath_resolved:
+            _classpath = _build_classpath()
+            _classpath_resolved = True
+        return _classpath
+
+
+def set_classpath(classpath: Optional[str]) -> None:
+    """
+    Use a classpath resolved elsewhere instead of running Maven again.
+
+    Worker processes call this with the parent's classpath so they do not
+    each rebuild target/classes and target/classpath.txt at the same time.
+
+    Args:
+        classpath: Value returned by resolve_classpath in the parent process
+    """
+    global _classpath, _classpath_resolved
+    with _classpath_lock:
+        _classpath = classpath
+        _classpath_resolved = True
+
+
+def _build_classpath() -> Optional[str]:
+    """Run Maven to compile the project and build the runtime classpath"""
+    if _MVN is None or _JAVA is None:
+        return None
+
+    cmd = [
+        _MVN, "-q", "compile", "dependency:build-classpath",
+        f"-Dmdep.outputFile={_CLASSPATH_FILE}"
+    ]
+
+    try:
+        subprocess.run(cmd, cwd=_PROJECT_ROOT, capture_output=True, check=True, timeout=300)
+        with open(_CLASSPATH_FILE) as f:
+            dependencies = f.read().strip()
+    except (OSError, subprocess.SubprocessError):
+        return None
+
+    if not dependencies:
+        return _CLASSES_DIR
+    return os.pathsep.join([_CLASSES_DIR, dependencies])
+
+
+def build_java_command(exec_args: List[str]) -> List[str]:
+    """
+    Build the command line that runs the GA with the given program arguments.
+
+    Args:
+        exec_args: Arguments passed to the Java main class
+
+    Returns:
+        Command list for subprocess, using a direct `java` launch when the
+        classpath is known and `mvn compile exec:java` otherwise
+    """
+    classpath = resolve_classpath()
+    if classpath is None:
+        # The classpath step also compiles, so when it was skipped (no
+        # `java` on PATH) or failed, compile here rather than run a stale
+        # target/classes
+        return [_MVN or "mvn", "-q", "compile", "exec:java", f"-Dexec.args={' '.join(exec_args)}"]
+
+    return [_JAVA, "-cp", classpath, _MAIN_CLASS, *exec_args]
@@ -384,7 +384,11 @@ class JsonInputLoader {
     private static final Gson gson = new Gson();
     
     public static JsonInput loadFromFile(String filename) throws IOException {
-        String content = new String(Files.readAllBytes(Paths.get(filename)));
+        // "-" reads the input JSON from stdin instead of a file
+        byte[] bytes = filename.equals("-")
+                ? System.in.readAllBytes()
+                : Files.readAllBytes(Paths.get(filename));
+        String content = new String(bytes);
         return gson.fromJson(content, JsonInput.class);
     }
     